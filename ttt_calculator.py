@@ -1,13 +1,598 @@
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk, messagebox, filedialog
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 import yfinance as yf
 from datetime import datetime, timedelta
 import matplotlib.pyplot as plt
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 import threading
 import time
+import argparse
+import csv
+import html
+import os
+import shutil
+import sys
+import tempfile
+
+# Define common futures contracts
+FUTURES_CONTRACTS = {
+    "ES (S&P 500 E-mini)": "ES=F",
+    "NQ (Nasdaq E-mini)": "NQ=F",
+    "YM (Dow E-mini)": "YM=F",
+    "RTY (Russell E-mini)": "RTY=F",
+    "CL (Crude Oil)": "CL=F",
+    "GC (Gold)": "GC=F",
+    "SI (Silver)": "SI=F",
+    "ZB (30Y T-Bond)": "ZB=F",
+    "ZN (10Y T-Note)": "ZN=F",
+    "6E (Euro FX)": "6E=F",
+    "6J (Japanese Yen)": "6J=F",
+    "6B (British Pound)": "6B=F"
+}
+
+def fetch_price_data(symbol, start_date, end_date, max_retries=3, on_status=None):
+    """Download daily OHLC data for a symbol, retrying on failure"""
+    retry_count = 0
+    data = None
+
+    while retry_count < max_retries and data is None:
+        try:
+            # Update status
+            if on_status:
+                on_status(f"Downloading... ({retry_count + 1}/{max_retries})")
+
+            # Download data with a timeout
+            data = yf.download(symbol,
+                             start=start_date,
+                             end=end_date,
+                             progress=False,
+                             timeout=10)
+
+            if data is None or data.empty:
+                raise ValueError(f"No data returned for {symbol}")
+
+        except Exception as download_error:
+            retry_count += 1
+            if retry_count == max_retries:
+                raise Exception(f"Failed to download data after {max_retries} attempts: {str(download_error)}")
+            if on_status:
+                on_status(f"Retrying... ({retry_count}/{max_retries})")
+            time.sleep(1)  # Wait 1 second before retrying
+
+    return data
+
+def verify_price_columns(data):
+    """Raise ValueError if data lacks any of the OHLC columns the calculations need"""
+    required_columns = ['Open', 'High', 'Low', 'Close']
+    missing_columns = [col for col in required_columns if col not in data.columns]
+    if missing_columns:
+        raise ValueError(f"Missing required columns: {', '.join(missing_columns)}")
+
+def calculate_envelope_data(price_data):
+    """Calculate Taylor's numbers, OB/OS, day types and next-day envelopes for every day"""
+    envelope_data = price_data.copy()
+
+    # Initialize Day_Type column with 'Undefined'
+    envelope_data['Day_Type'] = 'Undefined'
+
+    open_ = envelope_data['Open']
+    high = envelope_data['High']
+    low = envelope_data['Low']
+    close = envelope_data['Close']
+
+    # The first day has no previous day, day types need two previous days
+    position = np.arange(len(envelope_data))
+    first_day = position == 0
+
+    # Calculate overbought/oversold indicator
+    # Formula: (High - Open + Close - Low) / (2 * Range)
+    daily_range = high - low
+    ob_os = ((high - open_) + (close - low)) / (2 * daily_range) * 100  # Convert to percentage
+    envelope_data['OB_OS'] = ob_os.where(daily_range > 0, 50).mask(first_day)  # Neutral if no range
+
+    # Rally Number = Today's High - Yesterday's Low
+    envelope_data['Rally_Number'] = high - low.shift(1)
+
+    # Decline Number = Yesterday's High - Today's Low
+    envelope_data['Decline_Number'] = high.shift(1) - low
+
+    # Buy High Number = Today's High - Yesterday's High
+    envelope_data['Buy_High'] = high - high.shift(1)
+
+    # Buy Under Number = Yesterday's Low - Today's Low
+    envelope_data['Buy_Under'] = low.shift(1) - low
+
+    # Pivot Breakout Numbers
+    pivot = (high + low + close) / 3
+    envelope_data['Pivot_Buy'] = ((2 * pivot) - low).mask(first_day)
+    envelope_data['Pivot_Sell'] = ((2 * pivot) - high).mask(first_day)
+
+    # Calculate Level 1 trade points
+    envelope_data['Level1_Buy'] = (open_ - 0.30).mask(first_day)  # Buy 0.30 points below open
+    envelope_data['Level1_Sell'] = (open_ + 0.30).mask(first_day)  # Sell 0.30 points above open
+
+    # Identify Day Type
+    yesterday_open = open_.shift(1)
+    yesterday_high = high.shift(1)
+    yesterday_low = low.shift(1)
+    yesterday_close = close.shift(1)
+    yesterday_range = yesterday_high - yesterday_low
+    has_history = position >= 2  # Need at least 3 days of data
+
+    # Modern adaptation of Taylor's cycle:
+    # Look for the patterns but allow for more flexibility
+
+    # Buy Day: Look for selling exhaustion and potential reversal
+    buy_day = has_history & (
+        (yesterday_low < low.shift(2)) |                                  # Lower low OR
+        ((yesterday_close < close.shift(2)) &                             # Lower close AND
+         ((yesterday_close - yesterday_low).abs() <                       # Close near lows
+          yesterday_range.abs() * 0.3)))                                  # Bottom 30% of range
+
+    # Sell Day: Look for strength after weakness
+    sell_day = has_history & (
+        ((yesterday_high > high.shift(2)) |                               # Higher high OR
+         (yesterday_close > yesterday_open)) &                            # Up close AND
+        (yesterday_close > yesterday_low + yesterday_range * 0.7))        # Close in upper 30%
+
+    # Sell Short Day: Look for failed strength
+    sell_short_day = has_history & (
+        (yesterday_high > high.shift(2)) &                                # Made new high BUT
+        (yesterday_close < yesterday_high - yesterday_range * 0.5))       # Closed in lower half
+
+    envelope_data['Day_Type'] = np.select(
+        [buy_day, sell_day, sell_short_day],
+        ['Buy Day', 'Sell Day', 'Sell Short Day'],
+        default='Undefined')
+
+    # Calculate next day's envelopes
+    next_day = calculate_next_day_envelopes(envelope_data)
+    for col in next_day.columns:
+        envelope_data[col] = next_day[col]
+
+    return envelope_data
+
+def calculate_next_day_envelopes(envelope_data):
+    """Project each day's next-day buy and sell envelopes from trailing 3-day averages"""
+    # Need at least 4 days of data for 3-day averages
+    enough_data = np.arange(len(envelope_data)) >= 3
+
+    # Calculate 3-day averages
+    decline_avg = envelope_data['Decline_Number'].rolling(3).mean()  # Yesterday's high minus today's low
+    buy_under_avg = envelope_data['Buy_Under'].rolling(3).mean()    # Yesterday's low minus today's low
+    rally_avg = envelope_data['Rally_Number'].rolling(3).mean()     # Today's high minus yesterday's low
+    buy_high_avg = envelope_data['Buy_High'].rolling(3).mean()      # Today's high minus yesterday's high
+
+    next_day = pd.DataFrame(index=envelope_data.index)
+
+    # Buy Envelope (Support)
+    # 1. Decline level: Today's high minus average decline
+    next_day['Decline_Level'] = (envelope_data['High'] - decline_avg).where(enough_data)
+    # 2. Buy Under level: Today's low minus average buy under
+    next_day['Buy_Under_Level'] = (envelope_data['Low'] - buy_under_avg).where(enough_data)
+
+    # Sell Envelope (Resistance)
+    # 1. Rally level: Today's low plus average rally
+    next_day['Rally_Level'] = (envelope_data['Low'] + rally_avg).where(enough_data)
+    # 2. Buy High level: Today's high plus average buy high
+    next_day['Buy_High_Level'] = (envelope_data['High'] + buy_high_avg).where(enough_data)
+
+    return next_day
+
+# Next day plan templates, keyed by day type
+_PLAN_TEMPLATES = {
+    'Buy Day': (
+        "LSS MECHANICAL SYSTEM - DAY 1 (LOW DAY)\n\n"
+        "CYCLE POSITION: First day of 3-day cycle\n"
+        "MECHANICAL ENTRY RULES:\n"
+        "• Place buy orders at or slightly below {low:.2f}\n"
+        "• Do not chase market if level is missed\n"
+        "• Must enter in first 2 hours of trading\n\n"
+
+        "ENVELOPE LEVELS (Rule #4):\n"
+        "• Buy Envelope Top: {buy_envelope_top:.2f}\n"
+        "• Buy Envelope Bottom: {buy_envelope_bottom:.2f}\n"
+        "• Key Support Zone: {low_zone:.2f} to {low:.2f}\n\n"
+
+        "MECHANICAL EXIT RULES:\n"
+        "• Initial Stop: Exactly at {low_stop:.2f}\n"
+        "• Exit ALL positions by close (Rule #5)\n"
+        "• Move to breakeven when price hits {low_breakeven:.2f}\n\n"
+
+        "REVERSAL RULES (Rule #7):\n"
+        "• If pattern fails (high made first), prepare for sell setup tomorrow\n"
+        "• If stopped out early, watch for reversal entry\n"
+        "• Do not add to losing trades after first 2 hours\n\n"
+
+        "CRITICAL REMINDERS:\n"
+        "• Place orders before price hits levels (Rule #3)\n"
+        "• Take losses quickly - good trades work immediately (Rule #5)\n"
+        "• Never hold losing positions overnight (Rule #5)\n"
+    ),
+    'Sell Day': (
+        "LSS MECHANICAL SYSTEM - DAY 2 (SELL DAY)\n\n"
+        "CYCLE POSITION: Second day of 3-day cycle\n"
+        "MECHANICAL ENTRY RULES:\n"
+        "• Place sell orders at or slightly above {high:.2f}\n"
+        "• Must enter in first 2 hours after open\n"
+        "• Do not chase market if level is missed\n\n"
+
+        "ENVELOPE LEVELS (Rule #4):\n"
+        "• Sell Envelope Top: {sell_envelope_top:.2f}\n"
+        "• Sell Envelope Bottom: {sell_envelope_bottom:.2f}\n"
+        "• Key Resistance Zone: {high:.2f} to {high_zone_top:.2f}\n\n"
+
+        "MECHANICAL EXIT RULES:\n"
+        "• Initial Stop: Exactly at {high_stop:.2f}\n"
+        "• Exit ALL positions by close (Rule #5)\n"
+        "• Move to breakeven when price hits {high_breakeven:.2f}\n\n"
+
+        "REVERSAL RULES (Rule #7):\n"
+        "• If pattern fails (low made first), prepare for buy setup tomorrow\n"
+        "• If stopped out early, watch for reversal entry\n"
+        "• Do not add to losing trades after first 2 hours\n\n"
+
+        "CRITICAL REMINDERS:\n"
+        "• Place orders before price hits levels (Rule #3)\n"
+        "• Take losses quickly - good trades work immediately (Rule #5)\n"
+        "• Never hold positions overnight when cycle unclear\n"
+    ),
+    'Sell Short Day': (
+        "LSS MECHANICAL SYSTEM - DAY 3 (SELLSHORT DAY)\n\n"
+        "CYCLE POSITION: Third day of 3-day cycle\n"
+        "MECHANICAL ENTRY RULES:\n"
+        "• Place short orders at failed rally near {high:.2f}\n"
+        "• Must enter in first 2 hours of trading\n"
+        "• Do not chase market if level is missed\n\n"
+
+        "ENVELOPE LEVELS (Rule #4):\n"
+        "• Sell Envelope Top: {sell_envelope_top:.2f}\n"
+        "• Sell Envelope Bottom: {sell_envelope_bottom:.2f}\n"
+        "• Key Resistance Zone: {high_zone_bottom:.2f} to {high:.2f}\n\n"
+
+        "MECHANICAL EXIT RULES:\n"
+        "• Initial Stop: Exactly at {high_stop:.2f}\n"
+        "• Exit ALL positions by close (Rule #5)\n"
+        "• Move to breakeven when price hits {high_breakeven:.2f}\n\n"
+
+        "REVERSAL RULES (Rule #7):\n"
+        "• If pattern fails, push cycle ahead one day\n"
+        "• If stopped out early, watch for reversal entry\n"
+        "• Cover shorts near close to prepare for new cycle\n\n"
+
+        "CRITICAL REMINDERS:\n"
+        "• Place orders before price hits levels (Rule #3)\n"
+        "• Take losses quickly - good trades work immediately (Rule #5)\n"
+        "• Never hold losing positions overnight (Rule #5)\n"
+    ),
+    'Undefined': (
+        "LSS MECHANICAL SYSTEM - CYCLE IDENTIFICATION\n\n"
+        "CURRENT STATUS: Awaiting clear cycle start\n"
+        "MECHANICAL RULES FOR CYCLE IDENTIFICATION:\n\n"
+
+        "ENTRY CRITERIA:\n"
+        "• Wait for clear low day pattern\n"
+        "• Must see early weakness followed by strength\n"
+        "• Do not force trades when cycle unclear\n\n"
+
+        "KEY REFERENCE LEVELS:\n"
+        "• Previous High: {high:.2f}\n"
+        "• Previous Low: {low:.2f}\n"
+        "• Daily Range: {daily_range:.2f}\n\n"
+
+        "ENVELOPE LEVELS (Rule #4):\n"
+        "• Buy Envelope: {buy_envelope_bottom:.2f} to {buy_envelope_top:.2f}\n"
+        "• Sell Envelope: {sell_envelope_bottom:.2f} to {sell_envelope_top:.2f}\n\n"
+
+        "CRITICAL REMINDERS:\n"
+        "• Track cycle every day (Rule #1)\n"
+        "• Focus on single market (Rule #6)\n"
+        "• Wait for clear mechanical entry signal\n"
+        "• Never hold positions overnight when cycle unclear\n"
+    ),
+}
+_LEVEL1_BUY_TEMPLATE = "\n\nLevel 1 Buy Setup: Watch for early dip to {:.2f} (0.30 below open)"
+_LEVEL1_SELL_TEMPLATE = "\n\nLevel 1 Sell Setup: Watch for early rally to {:.2f} (0.30 above open)"
+_LEVEL1_BOTH_TEMPLATE = "\n\nLevel 1 Setups:\n- Buy below {:.2f}\n- Sell above {:.2f}"
+
+def build_next_day_plan(day_type, last_row):
+    """Generate trade plan based on the LSS mechanical day-trading system"""
+
+    # Calculate key reference levels
+    high = last_row['High']
+    low = last_row['Low']
+    daily_range = high - low
+
+    # Calculate envelope levels (Rule #4)
+    envelope_top = high + daily_range * 0.2
+    envelope_bottom = low - daily_range * 0.2
+
+    template = _PLAN_TEMPLATES.get(day_type, _PLAN_TEMPLATES['Undefined'])
+    plan = template.format(
+        high=high,
+        low=low,
+        daily_range=daily_range,
+        buy_envelope_top=envelope_top,
+        buy_envelope_bottom=envelope_bottom,
+        sell_envelope_top=envelope_top,
+        sell_envelope_bottom=envelope_bottom,
+        low_zone=low - daily_range*0.1,
+        low_stop=low - daily_range*0.15,
+        low_breakeven=low + daily_range*0.3,
+        high_zone_top=high + daily_range*0.1,
+        high_zone_bottom=high - daily_range*0.1,
+        high_stop=high + daily_range*0.15,
+        high_breakeven=high - daily_range*0.3,
+    )
+
+    # Add Level 1 trade guidance to next day plan
+    ob_os = last_row.get('OB_OS', 50)
+    level1_buy = last_row['Level1_Buy']
+    level1_sell = last_row['Level1_Sell']
+
+    if ob_os <= 30:  # Oversold - Look for buys
+        plan += _LEVEL1_BUY_TEMPLATE.format(level1_buy)
+    elif ob_os >= 70:  # Overbought - Look for sells
+        plan += _LEVEL1_SELL_TEMPLATE.format(level1_sell)
+    else:
+        plan += _LEVEL1_BOTH_TEMPLATE.format(level1_buy, level1_sell)
+
+    return plan
+
+# Envelope table rows shown alongside each plan in reports: (label, envelope_data column)
+REPORT_LEVELS = (
+    ("Decline Level", 'Decline_Level'),
+    ("Buy Under Level", 'Buy_Under_Level'),
+    ("Today's Low", 'Low'),
+    ("Pivot Sell", 'Pivot_Sell'),
+    ("Rally Level", 'Rally_Level'),
+    ("Buy High Level", 'Buy_High_Level'),
+    ("Today's High", 'High'),
+    ("Pivot Buy", 'Pivot_Buy'),
+    ("OB/OS", 'OB_OS'),
+    ("Level1_Buy", 'Level1_Buy'),
+    ("Level1_Sell", 'Level1_Sell'),
+)
+REPORT_FORMATS = ('md', 'html', 'csv')
+
+def iter_next_day_plans(symbol, envelope_data):
+    """Yield (symbol, date, row, plan) for every day with a complete next-day envelope"""
+    # Need at least 4 days of data for 3-day averages
+    for date, row in envelope_data.iloc[3:].iterrows():
+        yield symbol, date, row, build_next_day_plan(row['Day_Type'], row)
+
+def iter_symbol_envelopes(symbols, days):
+    """Download each symbol in turn and yield (symbol, envelope_data), one symbol in memory at a time"""
+    end_date = datetime.now()
+    start_date = end_date - timedelta(days=days)
+
+    # Format dates for yfinance
+    start_date = start_date.strftime('%Y-%m-%d')
+    end_date = end_date.strftime('%Y-%m-%d')
+
+    for symbol in symbols:
+        try:
+            data = fetch_price_data(symbol, start_date, end_date)
+        except Exception as e:
+            print(f"Skipping {symbol}: {str(e)}", file=sys.stderr)
+            continue
+        if data.empty:
+            print(f"Skipping {symbol}: no data found", file=sys.stderr)
+            continue
+        try:
+            verify_price_columns(data)
+            envelope_data = calculate_envelope_data(data)
+        except Exception as e:
+            print(f"Skipping {symbol}: {str(e)}", file=sys.stderr)
+            continue
+        yield symbol, envelope_data
+
+def iter_symbol_plans(envelopes):
+    """Yield the next-day plans of every (symbol, envelope_data) pair"""
+    for symbol, envelope_data in envelopes:
+        yield from iter_next_day_plans(symbol, envelope_data)
+
+_MD_HEADER_TEMPLATE = "## {} {} ({})\n\n| Level | Value |\n| --- | ---: |\n"
+_MD_ROW_TEMPLATE = "| {} | {:.2f} |\n"
+_MD_PLAN_TEMPLATE = "\n```\n{}\n```\n\n"
+
+def _write_markdown_report(out, plans):
+    out.write("# TTT Next Day Plans\n\n")
+    for symbol, date, row, plan in plans:
+        out.write(_MD_HEADER_TEMPLATE.format(symbol, date.strftime('%Y-%m-%d'), row['Day_Type']))
+        for label, col in REPORT_LEVELS:
+            out.write(_MD_ROW_TEMPLATE.format(label, row[col]))
+        out.write(_MD_PLAN_TEMPLATE.format(plan))
+
+_HTML_HEADER_TEMPLATE = ("<section>\n<h2>{} {} ({})</h2>\n"
+                         "<table>\n<tr><th>Level</th><th>Value</th></tr>\n")
+_HTML_ROW_TEMPLATE = "<tr><td>{}</td><td>{:.2f}</td></tr>\n"
+_HTML_PLAN_TEMPLATE = "</table>\n<pre>{}</pre>\n</section>\n"
+
+def _write_html_report(out, plans):
+    out.write("<!DOCTYPE html>\n<html>\n<head>\n<meta charset=\"utf-8\">\n"
+              "<title>TTT Next Day Plans</title>\n</head>\n<body>\n"
+              "<h1>TTT Next Day Plans</h1>\n")
+    for symbol, date, row, plan in plans:
+        out.write(_HTML_HEADER_TEMPLATE.format(html.escape(symbol), date.strftime('%Y-%m-%d'),
+                                               html.escape(row['Day_Type'])))
+        for label, col in REPORT_LEVELS:
+            out.write(_HTML_ROW_TEMPLATE.format(html.escape(label), row[col]))
+        out.write(_HTML_PLAN_TEMPLATE.format(html.escape(plan)))
+    out.write("</body>\n</html>\n")
+
+def _write_csv_report(out, plans):
+    writer = csv.writer(out)
+    writer.writerow(['Symbol', 'Date', 'Day_Type'] + [col for _, col in REPORT_LEVELS] + ['Plan'])
+    for symbol, date, row, plan in plans:
+        writer.writerow([symbol, date.strftime('%Y-%m-%d'), row['Day_Type']]
+                        + [f"{row[col]:.2f}" for _, col in REPORT_LEVELS]
+                        + [plan])
+
+_REPORT_WRITERS = {
+    'md': _write_markdown_report,
+    'html': _write_html_report,
+    'csv': _write_csv_report,
+}
+
+def _report_format(path, fmt=None):
+    if fmt is None:
+        fmt = os.path.splitext(path)[1].lstrip('.').lower()
+        fmt = {'markdown': 'md', 'htm': 'html'}.get(fmt, fmt)
+    if fmt not in _REPORT_WRITERS:
+        raise ValueError(f"Unsupported report format: {fmt or path}. Use one of {', '.join(REPORT_FORMATS)}")
+    return fmt
+
+def write_plan_report(plans, path, fmt=None):
+    """Stream next-day plans to a Markdown, HTML or CSV file as they are generated"""
+    fmt = _report_format(path, fmt)
+    with open(path, 'w', encoding='utf-8', newline='') as out:
+        _REPORT_WRITERS[fmt](out, plans)
+
+# Stable column layout of exported envelope results
+ENVELOPE_SCHEMA = pa.schema([
+    ('Symbol', pa.string()),
+    ('Date', pa.date32()),
+    ('Open', pa.float64()),
+    ('High', pa.float64()),
+    ('Low', pa.float64()),
+    ('Close', pa.float64()),
+    ('Day_Type', pa.string()),
+    ('OB_OS', pa.float64()),
+    ('Rally_Number', pa.float64()),
+    ('Decline_Number', pa.float64()),
+    ('Buy_High', pa.float64()),
+    ('Buy_Under', pa.float64()),
+    ('Pivot_Buy', pa.float64()),
+    ('Pivot_Sell', pa.float64()),
+    ('Level1_Buy', pa.float64()),
+    ('Level1_Sell', pa.float64()),
+    ('Decline_Level', pa.float64()),
+    ('Buy_Under_Level', pa.float64()),
+    ('Rally_Level', pa.float64()),
+    ('Buy_High_Level', pa.float64()),
+])
+EXPORT_FORMATS = {
+    '.parquet': 'parquet',
+    '.pq': 'parquet',
+    '.arrow': 'arrow',
+    '.feather': 'arrow',
+    '.ipc': 'arrow',
+}
+
+def _export_format(path):
+    ext = os.path.splitext(path)[1].lower()
+    if ext not in EXPORT_FORMATS:
+        raise ValueError(f"Unsupported export format: {path}. Use one of {', '.join(EXPORT_FORMATS)}")
+    return EXPORT_FORMATS[ext]
+
+def envelope_table(symbol, envelope_data):
+    """Convert one symbol's envelope_data to an Arrow table with ENVELOPE_SCHEMA"""
+    dates = pd.DatetimeIndex(envelope_data.index)
+    if dates.tz is not None:
+        dates = dates.tz_localize(None)
+
+    arrays = [
+        pa.array([symbol] * len(envelope_data), pa.string()),
+        pa.array(dates.values.astype('datetime64[D]'), pa.date32()),
+    ]
+    for field in list(ENVELOPE_SCHEMA)[2:]:
+        values = envelope_data[field.name].to_numpy(dtype=field.type.to_pandas_dtype())
+        arrays.append(pa.array(values, field.type, from_pandas=True))  # NaN becomes null
+    return pa.Table.from_arrays(arrays, schema=ENVELOPE_SCHEMA)
+
+def read_envelope_table(path, memory_map=True):
+    """Read exported envelope results as an Arrow table, memory-mapping the file by default
+
+    Only uncompressed Arrow IPC files are read zero-copy; Parquet pages are always decoded.
+    """
+    if _export_format(path) == 'parquet':
+        table = pq.read_table(path, memory_map=memory_map)
+    elif memory_map:
+        # Uncompressed IPC files are read zero-copy straight from the mapping
+        with pa.memory_map(path, 'r') as source:
+            table = pa.ipc.open_file(source).read_all()
+    else:
+        with pa.OSFile(path, 'rb') as source:
+            table = pa.ipc.open_file(source).read_all()
+
+    if not table.schema.equals(ENVELOPE_SCHEMA):
+        missing = [name for name in ENVELOPE_SCHEMA.names if name not in table.schema.names]
+        if missing:
+            raise ValueError(f"{path} is missing envelope columns: {', '.join(missing)}")
+        table = table.select(ENVELOPE_SCHEMA.names).cast(ENVELOPE_SCHEMA)
+    return table
+
+def _upsert_days(existing, table):
+    # Newly calculated rows replace stored rows for the same symbol and date,
+    # so a partial intraday bar is overwritten once the day is complete
+    new_tables = []
+    for symbol in pc.unique(table['Symbol']).to_pylist():
+        rows = table.filter(pc.equal(table['Symbol'], symbol))
+        stored_dates = existing.filter(pc.equal(existing['Symbol'], symbol))['Date'].combine_chunks()
+
+        # The first 3 days of a calculation lack the history for day types and
+        # envelopes, so they never overwrite stored days
+        warmup = rows.slice(0, 3)
+        new_tables.append(warmup.filter(pc.invert(pc.is_in(warmup['Date'], value_set=stored_dates))))
+        rows = rows.slice(3)
+        new_tables.append(rows)
+
+        stale = pc.and_(pc.equal(existing['Symbol'], symbol),
+                        pc.is_in(existing['Date'], value_set=rows['Date'].combine_chunks()))
+        existing = existing.filter(pc.invert(stale))
+    table = pa.concat_tables([existing] + new_tables)
+    return table.sort_by([('Symbol', 'ascending'), ('Date', 'ascending')])
+
+def export_envelope_data(path, envelopes, append=False):
+    """Export (symbol, envelope_data) pairs to an Arrow IPC or Parquet file
+
+    With append, stored days are kept and newly calculated days replace stored rows
+    for the same symbol and date.
+    """
+    fmt = _export_format(path)
+    tables = [envelope_table(symbol, envelope_data) for symbol, envelope_data in envelopes]
+    table = pa.concat_tables(tables) if tables else ENVELOPE_SCHEMA.empty_table()
+    if append and os.path.exists(path):
+        # Read into memory: a file that is still mapped cannot be replaced on Windows
+        table = _upsert_days(read_envelope_table(path, memory_map=False), table)
+
+    # Write next to the target and swap it in so readers never see a partial file
+    directory, name = os.path.split(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(prefix=name + '.', suffix='.tmp', dir=directory)
+    os.close(fd)
+    try:
+        # mkstemp creates the file as 0600; give it the permissions other readers expect
+        if os.path.exists(path):
+            shutil.copymode(path, tmp_path)
+        else:
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(tmp_path, 0o666 & ~umask)
+
+        if fmt == 'parquet':
+            pq.write_table(table, tmp_path)
+        else:
+            with pa.OSFile(tmp_path, 'wb') as sink:
+                with pa.ipc.new_file(sink, ENVELOPE_SCHEMA) as writer:
+                    writer.write_table(table)
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+def load_envelope_data(path, symbol):
+    """Load one symbol's exported envelope results back into an envelope_data DataFrame"""
+    table = read_envelope_table(path)
+    table = table.filter(pc.equal(table['Symbol'], symbol)).drop_columns(['Symbol'])
+    envelope_data = table.to_pandas(date_as_object=False)
+    return envelope_data.set_index('Date')
 
 class ToolTip(object):
     def __init__(self, widget, text):
@@ -108,20 +693,7 @@ class TTTCalculator:
         self.root.title("Taylor Trading Technique Calculator")
         
         # Define common futures contracts
-        self.futures_contracts = {
-            "ES (S&P 500 E-mini)": "ES=F",
-            "NQ (Nasdaq E-mini)": "NQ=F",
-            "YM (Dow E-mini)": "YM=F",
-            "RTY (Russell E-mini)": "RTY=F",
-            "CL (Crude Oil)": "CL=F",
-            "GC (Gold)": "GC=F",
-            "SI (Silver)": "SI=F",
-            "ZB (30Y T-Bond)": "ZB=F",
-            "ZN (10Y T-Note)": "ZN=F",
-            "6E (Euro FX)": "6E=F",
-            "6J (Japanese Yen)": "6J=F",
-            "6B (British Pound)": "6B=F"
-        }
+        self.futures_contracts = dict(FUTURES_CONTRACTS)
         
         # Define day ranges
         self.day_ranges = ["30 Days", "60 Days", "90 Days", "120 Days", "250 Days"]
@@ -159,12 +731,18 @@ class TTTCalculator:
         self.calc_button = ttk.Button(input_frame, text="Calculate", command=self.calculate)
         self.calc_button.grid(row=0, column=4, padx=10)
         
+        # Export Button
+        self.export_button = ttk.Button(input_frame, text="Export...", command=self.export_results)
+        self.export_button.grid(row=0, column=5, padx=5)
+        
         # Create tooltips for dropdowns and labels
         self.tooltips = {}
         self.create_tooltip(self.contract_dropdown, 
             "Select the futures contract to analyze.\nThe LSS system works best with volatile contracts.")
         self.create_tooltip(self.days_dropdown,
             "Select the number of days to analyze.\nMore data helps identify cycles but may slow calculations.")
+        self.create_tooltip(self.export_button,
+            "Save the calculated levels to a Parquet or Arrow file.\nExisting files are updated with the calculated days.")
             
         # Add tooltips for buy envelope
         self.decline_label = ttk.Label(main_frame, text="Decline Level: N/A")
@@ -245,6 +823,7 @@ Level1_Sell: First resistance level"""
         
         # Initialize data storage
         self.price_data = pd.DataFrame()
+        self.price_symbol = None
         
         # Add Next Day Plan frame
         plan_frame = ttk.LabelFrame(main_frame, text="Next Day Plan", padding="10")
@@ -289,33 +868,9 @@ Level1_Sell: First resistance level"""
             end_date = end_date.strftime('%Y-%m-%d')
 
             # Try to download data with retries
-            max_retries = 3
-            retry_count = 0
-            data = None
-            
-            while retry_count < max_retries and data is None:
-                try:
-                    # Update status
-                    self.root.after(0, lambda: self.calc_button.configure(
-                        text=f"Downloading... ({retry_count + 1}/{max_retries})"))
-                    
-                    # Download data with a timeout
-                    data = yf.download(symbol, 
-                                     start=start_date, 
-                                     end=end_date, 
-                                     progress=False,
-                                     timeout=10)
-                    
-                    if data is None or data.empty:
-                        raise ValueError(f"No data returned for {symbol}")
-                    
-                except Exception as download_error:
-                    retry_count += 1
-                    if retry_count == max_retries:
-                        raise Exception(f"Failed to download data after {max_retries} attempts: {str(download_error)}")
-                    self.root.after(0, lambda: self.calc_button.configure(
-                        text=f"Retrying... ({retry_count}/{max_retries})"))
-                    time.sleep(1)  # Wait 1 second before retrying
+            data = fetch_price_data(symbol, start_date, end_date,
+                                    on_status=lambda text: self.root.after(
+                                        0, lambda: self.calc_button.configure(text=text)))
             
             if data.empty:
                 self.root.after(0, lambda: messagebox.showerror("Error", 
@@ -323,15 +878,13 @@ Level1_Sell: First resistance level"""
                 return
             
             # Verify required columns exist
-            required_columns = ['Open', 'High', 'Low', 'Close']
-            missing_columns = [col for col in required_columns if col not in data.columns]
-            if missing_columns:
-                raise ValueError(f"Missing required columns: {', '.join(missing_columns)}")
+            verify_price_columns(data)
             
             # Show processing status
             self.root.after(0, lambda: self.calc_button.configure(text="Processing..."))
             
             self.price_data = data
+            self.price_symbol = symbol
             
             # Run original functions on main thread
             self.root.after(0, self.calculate_envelopes)
@@ -348,116 +901,22 @@ Level1_Sell: First resistance level"""
         if self.price_data.empty:
             return
             
-        # Initialize envelope data
-        self.envelope_data = self.price_data.copy()
-        
-        # Initialize Day_Type column with 'Undefined'
-        self.envelope_data['Day_Type'] = 'Undefined'
-        
-        # Calculate Taylor's numbers and overbought/oversold indicator
-        for i in range(1, len(self.envelope_data)):
-            today = self.envelope_data.iloc[i]
-            
-            # Calculate overbought/oversold indicator
-            # Formula: (High - Open + Close - Low) / (2 * Range)
-            daily_range = today['High'] - today['Low']
-            if daily_range > 0:  # Avoid division by zero
-                ob_os = ((today['High'] - today['Open']) + (today['Close'] - today['Low'])) / (2 * daily_range)
-                self.envelope_data.loc[self.envelope_data.index[i], 'OB_OS'] = ob_os * 100  # Convert to percentage
-            else:
-                self.envelope_data.loc[self.envelope_data.index[i], 'OB_OS'] = 50  # Neutral if no range
-            
-            # Rally Number = Today's High - Yesterday's Low
-            self.envelope_data.loc[self.envelope_data.index[i], 'Rally_Number'] = \
-                self.envelope_data.iloc[i]['High'] - self.envelope_data.iloc[i-1]['Low']
-            
-            # Decline Number = Yesterday's High - Today's Low
-            self.envelope_data.loc[self.envelope_data.index[i], 'Decline_Number'] = \
-                self.envelope_data.iloc[i-1]['High'] - self.envelope_data.iloc[i]['Low']
-            
-            # Buy High Number = Today's High - Yesterday's High
-            self.envelope_data.loc[self.envelope_data.index[i], 'Buy_High'] = \
-                self.envelope_data.iloc[i]['High'] - self.envelope_data.iloc[i-1]['High']
-            
-            # Buy Under Number = Yesterday's Low - Today's Low
-            self.envelope_data.loc[self.envelope_data.index[i], 'Buy_Under'] = \
-                self.envelope_data.iloc[i-1]['Low'] - self.envelope_data.iloc[i]['Low']
-            
-            # Pivot Breakout Numbers
-            pivot = (self.envelope_data.iloc[i]['High'] + self.envelope_data.iloc[i]['Low'] + self.envelope_data.iloc[i]['Close']) / 3
-            self.envelope_data.loc[self.envelope_data.index[i], 'Pivot_Buy'] = \
-                (2 * pivot) - self.envelope_data.iloc[i]['Low']
-            self.envelope_data.loc[self.envelope_data.index[i], 'Pivot_Sell'] = \
-                (2 * pivot) - self.envelope_data.iloc[i]['High']
-            
-            # Calculate Level 1 trade points
-            level1_buy = today['Open'] - 0.30  # Buy 0.30 points below open
-            level1_sell = today['Open'] + 0.30  # Sell 0.30 points above open
-            
-            self.envelope_data.loc[self.envelope_data.index[i], 'Level1_Buy'] = level1_buy
-            self.envelope_data.loc[self.envelope_data.index[i], 'Level1_Sell'] = level1_sell
-            
-            # Identify Day Type
-            if i >= 2:  # Need at least 3 days of data
-                today = self.envelope_data.iloc[i]
-                yesterday = self.envelope_data.iloc[i-1]
-                day_before = self.envelope_data.iloc[i-2]
-                
-                # Modern adaptation of Taylor's cycle:
-                # Look for the patterns but allow for more flexibility
-                
-                # Buy Day: Look for selling exhaustion and potential reversal
-                if (yesterday['Low'] < day_before['Low'] or                    # Lower low OR
-                    (yesterday['Close'] < day_before['Close'] and              # Lower close AND
-                     abs(yesterday['Close'] - yesterday['Low']) <              # Close near lows
-                     abs(yesterday['High'] - yesterday['Low']) * 0.3)):       # Bottom 30% of range
-                    self.envelope_data.loc[self.envelope_data.index[i], 'Day_Type'] = 'Buy Day'
-                
-                # Sell Day: Look for strength after weakness
-                elif ((yesterday['High'] > day_before['High'] or              # Higher high OR
-                      yesterday['Close'] > yesterday['Open']) and             # Up close AND
-                     yesterday['Close'] > yesterday['Low'] + 
-                     (yesterday['High'] - yesterday['Low']) * 0.7):           # Close in upper 30%
-                    self.envelope_data.loc[self.envelope_data.index[i], 'Day_Type'] = 'Sell Day'
-                
-                # Sell Short Day: Look for failed strength
-                elif (yesterday['High'] > day_before['High'] and              # Made new high BUT
-                      yesterday['Close'] < yesterday['High'] -                # Failed to hold it
-                      (yesterday['High'] - yesterday['Low']) * 0.5):          # Closed in lower half
-                    self.envelope_data.loc[self.envelope_data.index[i], 'Day_Type'] = 'Sell Short Day'
-                
-                else:
-                    self.envelope_data.loc[self.envelope_data.index[i], 'Day_Type'] = 'Undefined'
+        # Calculate Taylor's numbers, day types and next day's envelopes
+        self.envelope_data = calculate_envelope_data(self.price_data)
+        self.envelope_symbol = self.price_symbol
         
-        # Calculate next day's envelopes
         if len(self.envelope_data) >= 4:  # Need at least 4 days of data for 3-day averages
             last_row = self.envelope_data.iloc[-1]
             
-            # Calculate 3-day averages
-            decline_avg = self.envelope_data['Decline_Number'].tail(3).mean()  # Yesterday's high minus today's low
-            buy_under_avg = self.envelope_data['Buy_Under'].tail(3).mean()    # Yesterday's low minus today's low
-            rally_avg = self.envelope_data['Rally_Number'].tail(3).mean()     # Today's high minus yesterday's low
-            buy_high_avg = self.envelope_data['Buy_High'].tail(3).mean()      # Today's high minus yesterday's high
-            
             # Buy Envelope (Support)
-            # 1. Decline level: Today's high minus average decline
-            decline_level = last_row['High'] - decline_avg
-            # 2. Buy Under level: Today's low minus average buy under
-            buy_under_level = last_row['Low'] - buy_under_avg
-            # 3. Today's low
+            decline_level = last_row['Decline_Level']
+            buy_under_level = last_row['Buy_Under_Level']
             todays_low = last_row['Low']
-            # 4. Pivot Sell (resistance becomes support if broken)
-            pivot_sell = last_row['Pivot_Sell']
             
             # Sell Envelope (Resistance)
-            # 1. Rally level: Today's low plus average rally
-            rally_level = last_row['Low'] + rally_avg
-            # 2. Buy High level: Today's high plus average buy high
-            buy_high_level = last_row['High'] + buy_high_avg
-            # 3. Today's high
+            rally_level = last_row['Rally_Level']
+            buy_high_level = last_row['Buy_High_Level']
             todays_high = last_row['High']
-            # 4. Pivot Buy (support becomes resistance if broken)
-            pivot_buy = last_row['Pivot_Buy']
             
             # Update labels with day type context
             day_type = last_row.get('Day_Type', 'Undefined')
@@ -506,147 +965,28 @@ Level1_Sell: First resistance level"""
             self.update_next_day_plan(day_type, last_row)
 
     def update_next_day_plan(self, day_type, last_row):
-        """Generate trade plan based on the LSS mechanical day-trading system"""
-        
-        # Calculate key reference levels
-        daily_range = last_row['High'] - last_row['Low']
-        
-        # Calculate envelope levels (Rule #4)
-        buy_envelope_top = last_row['High'] + daily_range * 0.2
-        buy_envelope_bottom = last_row['Low'] - daily_range * 0.2
-        sell_envelope_top = last_row['High'] + daily_range * 0.2
-        sell_envelope_bottom = last_row['Low'] - daily_range * 0.2
-        
-        if day_type == 'Buy Day':
-            plan = (
-                f"LSS MECHANICAL SYSTEM - DAY 1 (LOW DAY)\n\n"
-                f"CYCLE POSITION: First day of 3-day cycle\n"
-                f"MECHANICAL ENTRY RULES:\n"
-                f"• Place buy orders at or slightly below {last_row['Low']:.2f}\n"
-                f"• Do not chase market if level is missed\n"
-                f"• Must enter in first 2 hours of trading\n\n"
-                
-                f"ENVELOPE LEVELS (Rule #4):\n"
-                f"• Buy Envelope Top: {buy_envelope_top:.2f}\n"
-                f"• Buy Envelope Bottom: {buy_envelope_bottom:.2f}\n"
-                f"• Key Support Zone: {last_row['Low'] - daily_range*0.1:.2f} to {last_row['Low']:.2f}\n\n"
-                
-                f"MECHANICAL EXIT RULES:\n"
-                f"• Initial Stop: Exactly at {last_row['Low'] - daily_range*0.15:.2f}\n"
-                f"• Exit ALL positions by close (Rule #5)\n"
-                f"• Move to breakeven when price hits {last_row['Low'] + daily_range*0.3:.2f}\n\n"
-                
-                f"REVERSAL RULES (Rule #7):\n"
-                f"• If pattern fails (high made first), prepare for sell setup tomorrow\n"
-                f"• If stopped out early, watch for reversal entry\n"
-                f"• Do not add to losing trades after first 2 hours\n\n"
-                
-                f"CRITICAL REMINDERS:\n"
-                f"• Place orders before price hits levels (Rule #3)\n"
-                f"• Take losses quickly - good trades work immediately (Rule #5)\n"
-                f"• Never hold losing positions overnight (Rule #5)\n"
-            )
-            
-        elif day_type == 'Sell Day':
-            plan = (
-                f"LSS MECHANICAL SYSTEM - DAY 2 (SELL DAY)\n\n"
-                f"CYCLE POSITION: Second day of 3-day cycle\n"
-                f"MECHANICAL ENTRY RULES:\n"
-                f"• Place sell orders at or slightly above {last_row['High']:.2f}\n"
-                f"• Must enter in first 2 hours after open\n"
-                f"• Do not chase market if level is missed\n\n"
-                
-                f"ENVELOPE LEVELS (Rule #4):\n"
-                f"• Sell Envelope Top: {sell_envelope_top:.2f}\n"
-                f"• Sell Envelope Bottom: {sell_envelope_bottom:.2f}\n"
-                f"• Key Resistance Zone: {last_row['High']:.2f} to {last_row['High'] + daily_range*0.1:.2f}\n\n"
-                
-                f"MECHANICAL EXIT RULES:\n"
-                f"• Initial Stop: Exactly at {last_row['High'] + daily_range*0.15:.2f}\n"
-                f"• Exit ALL positions by close (Rule #5)\n"
-                f"• Move to breakeven when price hits {last_row['High'] - daily_range*0.3:.2f}\n\n"
-                
-                f"REVERSAL RULES (Rule #7):\n"
-                f"• If pattern fails (low made first), prepare for buy setup tomorrow\n"
-                f"• If stopped out early, watch for reversal entry\n"
-                f"• Do not add to losing trades after first 2 hours\n\n"
-                
-                f"CRITICAL REMINDERS:\n"
-                f"• Place orders before price hits levels (Rule #3)\n"
-                f"• Take losses quickly - good trades work immediately (Rule #5)\n"
-                f"• Never hold positions overnight when cycle unclear\n"
-            )
-            
-        elif day_type == 'Sell Short Day':
-            plan = (
-                f"LSS MECHANICAL SYSTEM - DAY 3 (SELLSHORT DAY)\n\n"
-                f"CYCLE POSITION: Third day of 3-day cycle\n"
-                f"MECHANICAL ENTRY RULES:\n"
-                f"• Place short orders at failed rally near {last_row['High']:.2f}\n"
-                f"• Must enter in first 2 hours of trading\n"
-                f"• Do not chase market if level is missed\n\n"
-                
-                f"ENVELOPE LEVELS (Rule #4):\n"
-                f"• Sell Envelope Top: {sell_envelope_top:.2f}\n"
-                f"• Sell Envelope Bottom: {sell_envelope_bottom:.2f}\n"
-                f"• Key Resistance Zone: {last_row['High'] - daily_range*0.1:.2f} to {last_row['High']:.2f}\n\n"
-                
-                f"MECHANICAL EXIT RULES:\n"
-                f"• Initial Stop: Exactly at {last_row['High'] + daily_range*0.15:.2f}\n"
-                f"• Exit ALL positions by close (Rule #5)\n"
-                f"• Move to breakeven when price hits {last_row['High'] - daily_range*0.3:.2f}\n\n"
-                
-                f"REVERSAL RULES (Rule #7):\n"
-                f"• If pattern fails, push cycle ahead one day\n"
-                f"• If stopped out early, watch for reversal entry\n"
-                f"• Cover shorts near close to prepare for new cycle\n\n"
-                
-                f"CRITICAL REMINDERS:\n"
-                f"• Place orders before price hits levels (Rule #3)\n"
-                f"• Take losses quickly - good trades work immediately (Rule #5)\n"
-                f"• Never hold losing positions overnight (Rule #5)\n"
-            )
-            
-        else:
-            plan = (
-                f"LSS MECHANICAL SYSTEM - CYCLE IDENTIFICATION\n\n"
-                f"CURRENT STATUS: Awaiting clear cycle start\n"
-                f"MECHANICAL RULES FOR CYCLE IDENTIFICATION:\n\n"
-                
-                f"ENTRY CRITERIA:\n"
-                f"• Wait for clear low day pattern\n"
-                f"• Must see early weakness followed by strength\n"
-                f"• Do not force trades when cycle unclear\n\n"
-                
-                f"KEY REFERENCE LEVELS:\n"
-                f"• Previous High: {last_row['High']:.2f}\n"
-                f"• Previous Low: {last_row['Low']:.2f}\n"
-                f"• Daily Range: {daily_range:.2f}\n\n"
-                
-                f"ENVELOPE LEVELS (Rule #4):\n"
-                f"• Buy Envelope: {buy_envelope_bottom:.2f} to {buy_envelope_top:.2f}\n"
-                f"• Sell Envelope: {sell_envelope_bottom:.2f} to {sell_envelope_top:.2f}\n\n"
-                
-                f"CRITICAL REMINDERS:\n"
-                f"• Track cycle every day (Rule #1)\n"
-                f"• Focus on single market (Rule #6)\n"
-                f"• Wait for clear mechanical entry signal\n"
-                f"• Never hold positions overnight when cycle unclear\n"
-            )
-        
-        # Add Level 1 trade guidance to next day plan
-        ob_os = last_row.get('OB_OS', 50)
-        level1_buy = last_row['Level1_Buy']
-        level1_sell = last_row['Level1_Sell']
+        """Show the trade plan for the next day in the plan label"""
+        self.plan_label['text'] = build_next_day_plan(day_type, last_row)
+
+    def export_results(self):
+        if getattr(self, 'envelope_data', None) is None or self.envelope_data.empty:
+            messagebox.showerror("Error", "Nothing to export. Please calculate first.")
+            return
         
-        if ob_os <= 30:  # Oversold - Look for buys
-            plan += f"\n\nLevel 1 Buy Setup: Watch for early dip to {level1_buy:.2f} (0.30 below open)"
-        elif ob_os >= 70:  # Overbought - Look for sells
-            plan += f"\n\nLevel 1 Sell Setup: Watch for early rally to {level1_sell:.2f} (0.30 above open)"
-        else:
-            plan += f"\n\nLevel 1 Setups:\n- Buy below {level1_buy:.2f}\n- Sell above {level1_sell:.2f}"
+        # Existing files are merged into, not replaced
+        path = filedialog.asksaveasfilename(
+            title="Export Results (merges into an existing file)",
+            confirmoverwrite=False,
+            defaultextension=".parquet",
+            filetypes=[("Parquet", "*.parquet"), ("Arrow IPC", "*.arrow")])
+        if not path:
+            return
         
-        self.plan_label['text'] = plan
+        # Use the contract that was calculated, not the one currently selected
+        try:
+            export_envelope_data(path, [(self.envelope_symbol, self.envelope_data)], append=True)
+        except Exception as e:
+            messagebox.showerror("Error", f"Failed to export results: {str(e)}")
 
     def update_table(self):
         # Clear existing items
@@ -677,7 +1017,46 @@ Level1_Sell: First resistance level"""
             ]
             self.tree.insert('', 'end', values=values)
 
-def main():
+def build_arg_parser():
+    parser = argparse.ArgumentParser(description="Taylor Trading Technique Calculator")
+    parser.add_argument('--report', metavar='PATH',
+                        help="Write next-day plans to PATH instead of starting the GUI")
+    parser.add_argument('--format', choices=REPORT_FORMATS,
+                        help="Report format (default: taken from the PATH extension)")
+    parser.add_argument('--export', metavar='PATH',
+                        help="Export envelope results to a .parquet or .arrow file instead of starting the GUI")
+    parser.add_argument('--append', action='store_true',
+                        help="Merge into an existing export file, replacing stored rows for recalculated days")
+    parser.add_argument('--symbols', nargs='+', metavar='SYMBOL',
+                        help="Symbols to report on or export (default: all futures contracts)")
+    parser.add_argument('--days', type=int, default=365,
+                        help="Number of calendar days of history to download (default: 365)")
+    return parser
+
+def main(argv=None):
+    parser = build_arg_parser()
+    args = parser.parse_args(argv)
+    if args.report or args.export:
+        # Reject bad output paths before spending time on downloads
+        try:
+            if args.report:
+                _report_format(args.report, args.format)
+            if args.export:
+                _export_format(args.export)
+        except ValueError as e:
+            parser.error(str(e))
+
+        # Drop repeated symbols, keeping their order, so each symbol and date is stored once
+        symbols = list(dict.fromkeys(args.symbols or FUTURES_CONTRACTS.values()))
+        envelopes = iter_symbol_envelopes(symbols, args.days)
+        if args.report and args.export:
+            envelopes = list(envelopes)  # Download each symbol once for both outputs
+        if args.export:
+            export_envelope_data(args.export, envelopes, args.append)
+        if args.report:
+            write_plan_report(iter_symbol_plans(envelopes), args.report, args.format)
+        return
+
     try:
         root = tk.Tk()
         root.geometry("1200x800")  # Set a reasonable initial window size